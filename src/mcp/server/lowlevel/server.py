@@ -651,7 +651,7 @@ class Server(Generic[LifespanResultT, RequestT]):
                 case types.ClientNotification(root=notify):
                     await self._handle_notification(notify)
                 case Exception():
-                    logger.error(f"Received exception from stream: {message}")
+                    logger.error("Received exception from stream: %s", message)
                     await session.send_log_message(
                         level="error",
                         data="Internal Server Error",
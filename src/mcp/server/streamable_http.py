@@ -428,7 +428,7 @@ class StreamableHTTPServerTransport:
                             break
                         # For notifications and request, keep waiting
                         else:
-                            logger.debug(f"received: {event_message.message.root.method}")
+                            logger.debug("received: %s", event_message.message.root.method)
 
                     # At this point we should have a response
                     if response_message:
@@ -873,7 +873,7 @@ class StreamableHTTPServerTransport:
                         event_id = None
                         if self._event_store:
                             event_id = await self._event_store.store_event(request_stream_id, message)
-                            logger.debug(f"Stored {event_id} from {request_stream_id}")
+                            logger.debug("Stored %s from %s", event_id, request_stream_id)
 
                         if request_stream_id in self._request_streams:
                             try:
@@ -886,10 +886,10 @@ class StreamableHTTPServerTransport:
                                 # Stream might be closed, remove from registry
                                 self._request_streams.pop(request_stream_id, None)
                         else:
-                            logging.debug(
-                                f"""Request stream {request_stream_id} not found 
-                                for message. Still processing message as the client
-                                might reconnect and replay."""
+                            logger.debug(
+                                "Request stream %s not found for message. Still processing message as the client "
+                                "might reconnect and replay.",
+                                request_stream_id,
                             )
                 except Exception:
                     logger.exception("Error in message router")
@@ -360,8 +360,8 @@ class BaseSession(
                         except Exception as e:
                             # For request validation errors, send a proper JSON-RPC error
                             # response instead of crashing the server
-                            logging.warning(f"Failed to validate request: {e}")
-                            logging.debug(f"Message that failed validation: {message.message.root}")
+                            logging.warning("Failed to validate request: %s", e)
+                            logging.debug("Message that failed validation: %s", message.message.root)
                             error_response = JSONRPCError(
                                 jsonrpc="2.0",
                                 id=message.message.root.id,
@@ -408,7 +408,9 @@ class BaseSession(
                         except Exception as e:
                             # For other validation errors, log and continue
                             logging.warning(
-                                f"Failed to validate notification: {e}. Message was: {message.message.root}"
+                                "Failed to validate notification: %s. Message was: %s",
+                                e,
+                                message.message.root,
                             )
                     else:  # Response or error
                         stream = self._response_streams.pop(message.message.root.id, None)